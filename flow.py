@@ -1,4 +1,4 @@
-from collections import defaultdict
+from collections import defaultdict, deque
 from enum import Enum
 from typing import List
 from queue import Queue
@@ -7,6 +7,12 @@ from queue import Queue
 class FlowAlg(Enum):
     DINITZ = "DINITZ"
     EDMONDS_KARP = "EDMONDS-KARP"
+    BOYKOV_KOLMOGOROV = "BOYKOV-KOLMOGOROV"
+
+
+# search tree labels and parent markers used by Boykov-Kolmogorov
+FREE, SOURCE_TREE, SINK_TREE = 0, 1, 2
+ORPHAN, TERMINAL = -1, -2
 
 
 class FlowNetwork:
@@ -82,6 +88,216 @@ class FlowNetwork:
 
         return f, iterations
 
+    """
+    compute max flow using the Boykov-Kolmogorov algorithm
+    grows search trees from both source and dest and reuses them between augmentations,
+    which is much faster than Dinitz or Edmonds-Karp on grid graphs
+    """
+
+    def compute_max_flow_boykov_kolmogorov(self, graph: List[dict[int]]):
+        n = len(graph)
+        residual_graph = self.construct_residual_graph(graph)
+
+        # add reverse edges so every neighbor of u is a key of residual_graph[u]
+        for u in range(n):
+            for v in graph[u].keys():
+                residual_graph[v].setdefault(u, 0)
+
+        tree = [FREE] * n
+        parent = [ORPHAN] * n
+        timestamp = [0] * n
+        dist = [0] * n
+        is_active = [False] * n
+
+        tree[self.source] = SOURCE_TREE
+        tree[self.dest] = SINK_TREE
+        parent[self.source] = TERMINAL
+        parent[self.dest] = TERMINAL
+        active = deque([self.source, self.dest])
+        is_active[self.source] = True
+        is_active[self.dest] = True
+
+        iterations = 0
+        time = 0
+
+        while True:
+            # growth stage: expand the trees until they touch, collecting every edge
+            # between the trees found from the active vertex so a high degree vertex
+            # such as the source is not rescanned after each augmentation
+            bridges = []
+            while len(active) != 0:
+                u = active[0]
+                if tree[u] == FREE:
+                    active.popleft()
+                    is_active[u] = False
+                    continue
+
+                for v, c in residual_graph[u].items():
+                    capacity = c if tree[u] == SOURCE_TREE else residual_graph[v][u]
+                    if capacity <= 0:
+                        continue
+                    if tree[v] == FREE:
+                        tree[v] = tree[u]
+                        parent[v] = u
+                        timestamp[v] = timestamp[u]
+                        dist[v] = dist[u] + 1
+                        if not is_active[v]:
+                            active.append(v)
+                            is_active[v] = True
+                    elif tree[v] != tree[u]:
+                        bridges.append((u, v) if tree[u] == SOURCE_TREE else (v, u))
+
+                if len(bridges) != 0:
+                    break
+                active.popleft()
+                is_active[u] = False
+
+            if len(bridges) == 0:
+                break
+
+            for s_end, t_end in bridges:
+                while (
+                    tree[s_end] == SOURCE_TREE
+                    and tree[t_end] == SINK_TREE
+                    and residual_graph[s_end][t_end] > 0
+                ):
+                    iterations += 1
+                    time += 1
+                    orphans = self.augment_search_tree_path(
+                        residual_graph, tree, parent, s_end, t_end
+                    )
+                    self.adopt_orphans(
+                        residual_graph,
+                        tree,
+                        parent,
+                        timestamp,
+                        dist,
+                        active,
+                        is_active,
+                        orphans,
+                        time,
+                    )
+
+        # recover the flow on the edges of graph from the residual capacities
+        f = [defaultdict(int) for _ in range(n)]
+        for u in range(n):
+            for v, c in graph[u].items():
+                if c - residual_graph[u][v] > 0:
+                    f[u][v] = c - residual_graph[u][v]
+
+        return f, iterations
+
+    """
+    pushes the bottleneck capacity along the path from source to [s_end], across the edge
+    ([s_end], [t_end]) and from [t_end] to dest in the Boykov-Kolmogorov search trees
+    returns the vertices whose tree edge was saturated, which are now orphans
+    """
+
+    def augment_search_tree_path(self, residual_graph, tree, parent, s_end, t_end):
+        path = []
+        v = s_end
+        while v != self.source:
+            path.append((parent[v], v))
+            v = parent[v]
+        path.reverse()
+        path.append((s_end, t_end))
+        v = t_end
+        while v != self.dest:
+            path.append((v, parent[v]))
+            v = parent[v]
+
+        delta = min([residual_graph[u][v] for u, v in path])
+
+        orphans = []
+        for u, v in path:
+            residual_graph[u][v] -= delta
+            residual_graph[v][u] += delta
+            if residual_graph[u][v] > 0:
+                continue
+            if tree[u] == SOURCE_TREE and tree[v] == SOURCE_TREE:
+                parent[v] = ORPHAN
+                orphans.append(v)
+            elif tree[u] == SINK_TREE and tree[v] == SINK_TREE:
+                parent[u] = ORPHAN
+                orphans.append(u)
+
+        return orphans
+
+    """
+    reattaches each of [orphans] to a vertex of its own search tree that is still rooted at a terminal,
+    preferring the one closest to the root, and frees the orphans that cannot be reattached
+    [timestamp] and [dist] cache distances to the root computed during augmentation [time]
+    """
+
+    def adopt_orphans(
+        self,
+        residual_graph,
+        tree,
+        parent,
+        timestamp,
+        dist,
+        active,
+        is_active,
+        orphans,
+        time,
+    ):
+        while len(orphans) != 0:
+            u = orphans.pop()
+            new_parent, min_dist = None, float("inf")
+
+            for v, c in residual_graph[u].items():
+                if tree[v] != tree[u]:
+                    continue
+                capacity = residual_graph[v][u] if tree[u] == SOURCE_TREE else c
+                if capacity <= 0:
+                    continue
+
+                # walk up from v to check that it is still rooted at a terminal
+                d = 0
+                w = v
+                while True:
+                    if timestamp[w] == time:
+                        d += dist[w]
+                        break
+                    d += 1
+                    if parent[w] == TERMINAL:
+                        timestamp[w] = time
+                        dist[w] = 1
+                        break
+                    if parent[w] == ORPHAN:
+                        d = float("inf")
+                        break
+                    w = parent[w]
+
+                if d == float("inf"):
+                    continue
+                if d < min_dist:
+                    new_parent, min_dist = v, d
+                w = v
+                while timestamp[w] != time:
+                    timestamp[w] = time
+                    dist[w] = d
+                    d -= 1
+                    w = parent[w]
+
+            if new_parent is not None:
+                parent[u] = new_parent
+                timestamp[u] = time
+                dist[u] = min_dist + 1
+                continue
+
+            for v, c in residual_graph[u].items():
+                if tree[v] != tree[u]:
+                    continue
+                capacity = residual_graph[v][u] if tree[u] == SOURCE_TREE else c
+                if capacity > 0 and not is_active[v]:
+                    active.append(v)
+                    is_active[v] = True
+                if parent[v] == u:
+                    parent[v] = ORPHAN
+                    orphans.append(v)
+            tree[u] = FREE
+
     """
     computes the maximum size of a bipartite matching in a bipartite graph
     graph should have 2n vertices, L = [1, ..., n] and R = [n + 1, 2n]
@@ -105,6 +321,9 @@ class FlowNetwork:
         elif flow_alg == FlowAlg.EDMONDS_KARP:
             f, iterations = self.compute_max_flow_edmonds_karp(graph)
             return sum([f[0][i] for i in range(1, n + 1)]), iterations
+        elif flow_alg == FlowAlg.BOYKOV_KOLMOGOROV:
+            f, iterations = self.compute_max_flow_boykov_kolmogorov(graph)
+            return sum([f[0][i] for i in range(1, n + 1)]), iterations
 
     """
     takes a graph G represented by an adjacency list of capacities
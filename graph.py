@@ -1,5 +1,6 @@
 import matplotlib
 import matplotlib.pyplot as plt
+import itertools
 import random
 
 from typing import List
@@ -66,6 +67,56 @@ class Graph:
 
         return graph
 
+    """
+    generates a segmentation-style grid graph with side length k and the given neighborhood
+    neighborhood 4 gives a k x k grid, 6 and 26 give a k x k x k grid
+    vertex 0 is the source, vertex k^d + 1 is the sink and every pixel has an edge from the source
+    and an edge to the sink, neighboring pixels are joined in both directions by edges of equal capacity
+    all capacities are uniformly at random in [1, c], drawn from a generator seeded with [seed]
+    """
+
+    def generate_grid_graph(k: int, neighborhood: int, c: int, seed: int = None):
+        if neighborhood == 4:
+            dims = 2
+            offsets = [(0, 1), (1, 0), (0, -1), (-1, 0)]
+        elif neighborhood == 6:
+            dims = 3
+            offsets = [
+                (0, 0, 1),
+                (0, 1, 0),
+                (1, 0, 0),
+                (0, 0, -1),
+                (0, -1, 0),
+                (-1, 0, 0),
+            ]
+        elif neighborhood == 26:
+            dims = 3
+            offsets = list(itertools.product([-1, 0, 1], repeat=3))
+            offsets.remove((0, 0, 0))
+        else:
+            raise ValueError(f"unsupported neighborhood {neighborhood}, use 4, 6 or 26")
+
+        rng = random.Random(seed)
+        num_pixels = k**dims
+        sink = num_pixels + 1
+        graph = [{} for _ in range(num_pixels + 2)]
+
+        for coords in itertools.product(range(k), repeat=dims):
+            u = 1 + sum([x * k**i for i, x in enumerate(reversed(coords))])
+
+            graph[0][u] = rng.uniform(1, c)
+            graph[u][sink] = rng.uniform(1, c)
+
+            for offset in offsets:
+                neighbor = [x + dx for x, dx in zip(coords, offset)]
+                if any([x < 0 or x >= k for x in neighbor]):
+                    continue
+                v = 1 + sum([x * k**i for i, x in enumerate(reversed(neighbor))])
+                if v > u:
+                    graph[u][v] = graph[v][u] = rng.uniform(1, c)
+
+        return graph
+
     """
     plot graph with given parameters
     """
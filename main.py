@@ -41,6 +41,9 @@ def average_time_experiment(
                 elif flow_alg == FlowAlg.EDMONDS_KARP:
                     f, iters = network.compute_max_flow_edmonds_karp(graph)
                     iterations += iters
+                elif flow_alg == FlowAlg.BOYKOV_KOLMOGOROV:
+                    f, iters = network.compute_max_flow_boykov_kolmogorov(graph)
+                    iterations += iters
 
                 end_time = time.time()
                 total_time += end_time - start_time
@@ -161,6 +164,82 @@ def bipartite_reduction_experiment(
     )
 
 
+"""
+compute and plot the average time it takes to compute max flow on grid graphs over 10 trials for each side length in [5, 10, ..., k]
+neighborhood: 4 for 2D grids, 6 or 26 for 3D grids
+file_name: name of the output file
+graph_title: title of the graph
+flow_algs: flow algorithms to compare, the ratio plot divides the time of the first by the second
+k: maximum side length, defaults to 30
+"""
+
+
+def grid_experiment(neighborhood, file_name, graph_title, flow_algs, k=30):
+    results = [[] for _ in range(len(flow_algs))]
+    iteration_results = [[] for _ in range(len(flow_algs))]
+
+    for a, flow_alg in enumerate(flow_algs):
+        for i in range(5, k, 5):
+            total_time = 0
+            iterations = 0
+            non_zero_flows = 0
+
+            rounds = 10
+
+            for r in range(rounds):
+                graph = Graph.generate_grid_graph(i, neighborhood, 30, seed=r)
+                n = len(graph)
+                network = FlowNetwork(n, 0, n - 1)
+                start_time = time.time()
+
+                if flow_alg == FlowAlg.DINITZ:
+                    f, iters = network.compute_max_flow_dinitz(graph)
+                elif flow_alg == FlowAlg.EDMONDS_KARP:
+                    f, iters = network.compute_max_flow_edmonds_karp(graph)
+                elif flow_alg == FlowAlg.BOYKOV_KOLMOGOROV:
+                    f, iters = network.compute_max_flow_boykov_kolmogorov(graph)
+                iterations += iters
+
+                end_time = time.time()
+                total_time += end_time - start_time
+                if sum(f[0].values()) > 0:
+                    non_zero_flows += 1
+
+            results[a].append([i, total_time / rounds])
+            iteration_results[a].append([i, iterations / rounds])
+            print_experiment_results(
+                total_time / rounds, iterations / rounds, non_zero_flows, i
+            )
+
+    Graph.plot_graph(
+        [[x[0] for x in results[i]] for i in range(len(flow_algs))],
+        [[x[1] for x in results[i]] for i in range(len(flow_algs))],
+        [flow_alg.value for flow_alg in flow_algs],
+        "side length of grid",
+        "average time in seconds",
+        graph_title,
+        file_name,
+    )
+    Graph.plot_graph(
+        [[x[0] for x in results[0]]],
+        [[results[0][i][1] / results[1][i][1] for i in range(len(results[0]))]],
+        ["ratio"],
+        "side length of grid",
+        f"ratio of time for {flow_algs[0].value} to {flow_algs[1].value}",
+        f"ratio of time for {neighborhood}-neighborhood grid",
+        "ratio_" + file_name,
+    )
+    Graph.plot_graph(
+        [[x[0] for x in iteration_results[i]] for i in range(len(flow_algs))],
+        [[x[1] for x in iteration_results[i]] for i in range(len(flow_algs))],
+        [flow_alg.value for flow_alg in flow_algs],
+        "side length of grid",
+        "average iterations",
+        f"average number of iterations for {neighborhood}-neighborhood grid",
+        "iterations_" + file_name,
+    )
+
+
 def print_experiment_results(average_time, average_iterations, non_zero_flows, n):
     print(
         "n =",
@@ -206,3 +285,12 @@ if __name__ == "__main__":
         [FlowAlg.EDMONDS_KARP, FlowAlg.DINITZ],
         200,
     )
+
+    print("starting experiment for grid graphs")
+    grid_experiment(
+        4,
+        "grid.png",
+        "average time to compute max flow on 4-neighborhood grids",
+        [FlowAlg.DINITZ, FlowAlg.BOYKOV_KOLMOGOROV],
+        30,
+    )
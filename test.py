@@ -1,6 +1,8 @@
 import unittest
 
+from flow import FlowAlg
 from flow import FlowNetwork
+from graph import Graph
 from typing import List
 
 
@@ -95,6 +97,53 @@ class TestFlowMethods(unittest.TestCase):
                 )
             )
 
+    def test_compute_max_flow_boykov_kolmogorov(self):
+        networks = [[self.flow_network, self.graph], [self.flow_network2, self.graph2]]
+
+        for network, graph in networks:
+            f, _ = network.compute_max_flow_boykov_kolmogorov(graph)
+            dinitz_f, _ = network.compute_max_flow_dinitz(graph)
+            self.assertEqual(sum(f[0].values()), sum(dinitz_f[0].values()))
+            self.assertTrue(network.is_flow_feasible(graph, f))
+
+    def test_compute_max_bipartite_matching_size(self):
+        graph: List[dict[int]] = [{}, {4: 1, 5: 1}, {4: 1}, {6: 1}, {}, {}, {}]
+
+        for flow_alg in FlowAlg:
+            network = FlowNetwork(8, 0, 7)
+            size, _ = network.compute_max_bipartite_matching_size(
+                [dict(u) for u in graph[1:]], flow_alg
+            )
+            self.assertEqual(size, 3)
+
+    def test_generate_grid_graph(self):
+        for neighborhood, n, degree in [(4, 16, 4), (6, 64, 6), (26, 64, 26)]:
+            graph = Graph.generate_grid_graph(4, neighborhood, 30, seed=0)
+            self.assertEqual(len(graph), n + 2)
+            self.assertEqual(len(graph[0]), n)
+            self.assertEqual(max([len(graph[u]) - 1 for u in range(1, n + 1)]), degree)
+            for u in range(1, n + 1):
+                self.assertIn(n + 1, graph[u])
+                for v in graph[u]:
+                    if v != n + 1:
+                        self.assertEqual(graph[u][v], graph[v][u])
+
+        self.assertEqual(
+            Graph.generate_grid_graph(3, 4, 30, seed=1),
+            Graph.generate_grid_graph(3, 4, 30, seed=1),
+        )
+        with self.assertRaises(ValueError):
+            Graph.generate_grid_graph(3, 8, 30)
+
+    def test_compute_max_flow_grid(self):
+        for neighborhood in [4, 6, 26]:
+            graph = Graph.generate_grid_graph(3, neighborhood, 30, seed=0)
+            n = len(graph)
+            network = FlowNetwork(n, 0, n - 1)
+            f, _ = network.compute_max_flow_boykov_kolmogorov(graph)
+            dinitz_f, _ = network.compute_max_flow_dinitz(graph)
+            self.assertAlmostEqual(sum(f[0].values()), sum(dinitz_f[0].values()))
+
 
 if __name__ == "__main__":
     unittest.main()